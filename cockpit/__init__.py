@@ -179,7 +179,7 @@ class CockpitApp(wx.App):
             )
             self._stage = cockpit.interfaces.stageMover.mover
             self._channels = cockpit.interfaces.channels.Channels()
-            for fpath in self.Config['global'].getpaths('channel-files', []):
+            for fpath in self.Config.channel_files:
                 new_channels = cockpit.interfaces.channels.LoadFromFile(fpath)
                 self._channels.Update(new_channels)
 
@@ -380,6 +380,12 @@ def _parse_cmd_line_args(cmd_line_args: List[str]) -> argparse.Namespace:
         action="store_false",
         help="Do not read user and system config files"
     )
+    parser.add_argument(
+        "--no-config-cache",
+        dest="use_config_cache",
+        action="store_false",
+        help="Do not use or update the cache of parsed depot files"
+    )
 
     parser.add_argument(
         "--depot-file",
@@ -454,7 +460,7 @@ def _pre_gui_init(argv: List[str]) -> cockpit.config.CockpitConfig:
     config = cockpit.config.CockpitConfig(cmd_line_options)
     _configure_logging(config['log'])
 
-    data_dir = config.getpath('global', 'data-dir')
+    data_dir = config.data_dir
     _logger.info("Creating data-dir '%s' if needed", data_dir)
     os.makedirs(data_dir, exist_ok=True)
 
@@ -28,14 +28,17 @@ default config files and values, and command line options.
 
 import argparse
 import configparser
+import functools
+import hashlib
 import importlib
+import io
+import json
 import os
 import os.path
+import re
 import sys
 import typing
 
-import Pyro4
-
 
 _PROGRAM_NAME = 'cockpit'
 
@@ -55,25 +58,41 @@ class CockpitConfig(configparser.ConfigParser):
 
         ## Check if depot or config files specified exist (see #710).
         for fname in cmd_line_options.depot_files:
-            if not (os.path.isfile(fname) and os.access(fname, os.R_OK)):
+            if not _is_readable_file(fname):
                 raise Exception("Unable to read depot file %s" % fname)
         for fname in cmd_line_options.config_files:
-            if not (os.path.isfile(fname) and os.access(fname, os.R_OK)):
+            if not _is_readable_file(fname):
                 raise Exception("Unable to read config file %s" % fname)
 
         ## Read cockpit config files.  Least "important" files go
-        ## first so that later files can override option values.
+        ## first so that later files can override option values.  All
+        ## files are read in a single call to merge them in one pass.
+        config_files = []
         if cmd_line_options.read_system_config_files:
-            self.read(reversed(default_system_cockpit_config_files()))
+            config_files.extend(
+                reversed(default_system_cockpit_config_files()))
         if cmd_line_options.read_user_config_files:
-            self.read(reversed(default_user_cockpit_config_files()))
-        self.read(cmd_line_options.config_files)
+            config_files.extend(reversed(default_user_cockpit_config_files()))
+        config_files.extend(cmd_line_options.config_files)
+        self.read(config_files)
 
         ## Command line options take precedence over everything, so
         ## adding those to the config is done last.
         self._mixin_cmd_line_options(cmd_line_options)
 
-        self._depot_config = DepotConfig(self['global'].getpaths('depot-files'))
+        ## Options in the global section are read from multiple places
+        ## and do not change once all config has been read, so convert
+        ## them only once instead of on every access.
+        self._data_dir = self['global'].getpath('data-dir')
+        self._channel_files = self['global'].getpaths('channel-files')
+        self._depot_files = self['global'].getpaths('depot-files')
+
+        if cmd_line_options.use_config_cache:
+            depot_cache_dir = os.path.join(_default_user_cache_dir(), 'depot')
+        else:
+            depot_cache_dir = None
+        self._depot_config = DepotConfig(self._depot_files,
+                                         cache_dir=depot_cache_dir)
 
     def _mixin_cmd_line_options(self, options):
         ## Multiple depot config files behave different from cockpit
@@ -103,6 +122,24 @@ class CockpitConfig(configparser.ConfigParser):
     def _set_depot_files(self, depot_files):
         self.set('global', 'depot-files', '\n'.join(depot_files))
 
+    @property
+    def data_dir(self) -> str:
+        """Path for the ``data-dir`` option in the global section.
+        """
+        return self._data_dir
+
+    @property
+    def channel_files(self) -> typing.List[str]:
+        """Paths for the ``channel-files`` option in the global section.
+        """
+        return list(self._channel_files)
+
+    @property
+    def depot_files(self) -> typing.List[str]:
+        """Paths for the ``depot-files`` option in the global section.
+        """
+        return list(self._depot_files)
+
     @property
     def depot_config(self):
         """Instance of :class:`DepotConfig`.
@@ -122,15 +159,18 @@ class DepotConfig(configparser.ConfigParser):
 
     Args:
         filepaths (list<str>): list of files with device configurations.
+        cache_dir (str): directory to keep a cache of the parsed
+            files.  If ``None``, files are always parsed.
 
     Raises:
         ``configparser.DuplicateSectionError`` if there's more than
         one device definition on the same or different files.
 
     """
-    def __init__(self, filepaths):
+    def __init__(self, filepaths, cache_dir=None):
         super().__init__(converters=_type_converters, interpolation=None)
         self.files = [] # type: List[str]
+        self._cache_dir = cache_dir
         self.read(filepaths)
 
     def read(self, filenames, encoding=None):
@@ -148,13 +188,131 @@ class DepotConfig(configparser.ConfigParser):
         ## So we need to do this ourselves (add_section will raise an
         ## exception in case of duplicated sections).
         for filename in filenames:
-            file_config = configparser.ConfigParser()
-            if file_config.read(filename):
-                self.files.append(filename)
-                for new_section in file_config.sections():
-                    self.add_section(new_section)
-                    for k, v in file_config[new_section].items():
-                        self[new_section][k] = v
+            file_sections = _read_depot_file(filename, encoding,
+                                             self._cache_dir)
+            if file_sections is None:
+                continue # ConfigParser.read also skips unreadable files
+            self.files.append(filename)
+            for new_section, options in file_sections.items():
+                self.add_section(new_section)
+                for k, v in options.items():
+                    self.set(new_section, k, v)
+
+
+## Version of the depot cache file format.  Increase it whenever the
+## cached content or the output of `_fast_parse` changes so that
+## cache files written by older versions are not reused.
+_DEPOT_CACHE_VERSION = 1
+
+
+def _read_depot_file(filename, encoding=None, cache_dir=None):
+    """Read a single depot file into a dict of sections.
+
+    If ``cache_dir`` is not ``None``, the parsed file is kept there
+    and reused while the file modification time and size, the
+    encoding, and the cache format version remain the same.  The cache
+    is plain JSON, not pickle, so that a tampered cache file can not
+    run code.
+
+    Returns:
+        A ``dict`` of section names to ``dict`` of options, or
+        ``None`` if the file could not be read.
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    ## A list, not a tuple, to compare equal after a JSON round trip.
+    file_id = [stat.st_mtime_ns, stat.st_size, encoding]
+
+    if cache_dir is not None:
+        ## One cache file per depot file, so that cache files do not
+        ## accumulate as depot files get edited.
+        key = hashlib.sha1(os.fsencode(os.path.abspath(filename)))
+        cache_path = os.path.join(cache_dir, key.hexdigest() + '.json')
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as fh:
+                version, cached_id, sections = json.load(fh)
+            if version == _DEPOT_CACHE_VERSION and cached_id == file_id:
+                return sections
+        except Exception:
+            pass # missing or unusable cache file, so parse it again
+
+    try:
+        with open(filename, encoding=encoding) as fh:
+            text = fh.read()
+    except OSError:
+        return None
+
+    sections = _fast_parse(text)
+    if sections is None:
+        ## Syntax that is not handled by the fast parser, so let
+        ## ConfigParser handle it (and raise any parsing errors).
+        file_config = configparser.ConfigParser()
+        file_config.read_string(text, source=str(filename))
+        sections = {s: dict(file_config[s]) for s in file_config.sections()}
+
+    if cache_dir is not None:
+        ## Write to a temporary file and then replace so that another
+        ## cockpit instance never reads a partially written cache.
+        tmp_path = cache_path + '.%d.tmp' % os.getpid()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as fh:
+                json.dump([_DEPOT_CACHE_VERSION, file_id, sections], fh)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass # failing to cache is not a reason to fail
+    return sections
+
+
+## Regular expressions for the subset of the INI syntax handled by
+## `_fast_parse`.  Keys and values are delimited by ``=`` or ``:`` and
+## comments must be in their own line, same as ConfigParser defaults.
+_SECTION_RE = re.compile(r'^\[(?P<sec>[^\]]+)\]\s*$')
+_OPTION_RE = re.compile(r'^(?P<k>[^=:\s;#\[][^=:]*?)\s*[=:]\s*(?P<v>.*)$')
+
+def _fast_parse(
+    text: str
+) -> typing.Optional[typing.Dict[str, typing.Dict[str, str]]]:
+    """Parse the simple INI files that make most depot files.
+
+    Parsing depot files with ``ConfigParser`` is slow and most depot
+    files are just a list of sections with one ``key = value`` per
+    line.  This handles that case only.  Anything that may need
+    ``ConfigParser`` behaviour (multi-line values, interpolation,
+    ``DEFAULT`` section, duplicated sections or options, and
+    malformed lines) makes this return ``None``.
+    """
+    if '%' in text:
+        return None
+    sections = {} # type: typing.Dict[str, typing.Dict[str, str]]
+    options = None
+    ## Iterate a StringIO, like ConfigParser.read_string, because
+    ## str.splitlines also splits on characters such as \x0c and \x85
+    ## which ConfigParser keeps as part of the value.
+    for line in io.StringIO(text):
+        stripped = line.strip()
+        if not stripped or stripped[0] in '#;':
+            continue
+        elif line[0].isspace():
+            return None # continuation line of a multi-line value
+        match = _SECTION_RE.match(line)
+        if match is not None:
+            name = match.group('sec')
+            if name == configparser.DEFAULTSECT or name in sections:
+                return None
+            options = sections[name] = {}
+            continue
+        match = _OPTION_RE.match(line)
+        if match is None or options is None:
+            return None
+        key = match.group('k').lower() # same as ConfigParser.optionxform
+        if key in options:
+            return None
+        options[key] = match.group('v').strip()
+    return sections
+
 
 def _default_cockpit_config():
     default = {
@@ -166,7 +324,7 @@ def _default_cockpit_config():
             ## reading the cockpit config files and will also be
             ## dependent on command line options.
 #            'depot-files' : '',
-            'pyro-pickle-protocol': Pyro4.config.PICKLE_PROTOCOL_VERSION,
+            'pyro-pickle-protocol': _pyro_pickle_protocol(),
         },
         'log' : {
             'level' : 'error',
@@ -192,6 +350,13 @@ def _default_cockpit_config():
     return default
 
 
+def _pyro_pickle_protocol():
+    ## Pyro4 is imported here, and not at the module level, so that
+    ## importing this module does not pay for importing Pyro4.
+    import Pyro4
+    return Pyro4.config.PICKLE_PROTOCOL_VERSION
+
+
 def default_system_cockpit_config_files():
     return _default_system_config_files('cockpit.conf')
 
@@ -205,8 +370,14 @@ def default_user_depot_config_files():
     return _default_user_config_files('depot.conf')
 
 
+## The default directories depend on the platform and environment
+## variables which do not change during a cockpit session, so they
+## are only computed once.  Results are immutable (strings and
+## tuples) since they are shared by all callers.
+
+@functools.cache
 def _default_system_config_dirs():
-    """List of directories, most important first.
+    """Tuple of directories, most important first.
     """
     if _is_windows():
         try:
@@ -218,8 +389,9 @@ def _default_system_config_dirs():
     else: # freedesktop.org Base Directory Specification
         base_dirs = _get_nonempty_env('XDG_CONFIG_DIRS', r'/etc/xdg').split(':')
         base_dirs = [d for d in base_dirs if d] # remove empty entries
-    return [os.path.join(d, _PROGRAM_NAME) for d in base_dirs]
+    return tuple(os.path.join(d, _PROGRAM_NAME) for d in base_dirs)
 
+@functools.cache
 def _default_user_config_dir():
     if _is_windows():
         base_dir = os.path.expandvars(r'%LocalAppData%')
@@ -244,6 +416,7 @@ def _default_system_config_files(fname):
     return [os.path.join(d, fname) for d in _default_system_config_dirs()]
 
 
+@functools.cache
 def _default_log_dir():
     if _is_windows():
         try:
@@ -260,6 +433,22 @@ def _default_log_dir():
     return os.path.join(base_dir, _PROGRAM_NAME)
 
 
+@functools.cache
+def _default_user_cache_dir():
+    if _is_windows():
+        ## Same base directory as the user config so keep the cache
+        ## in its own subdirectory.
+        return os.path.join(_default_user_config_dir(), 'cache')
+    elif _is_mac():
+        base_dir = os.path.expanduser(r'~/Library/Caches')
+    else: # freedesktop.org Base Directory Specification
+        base_dir = _get_nonempty_env(r'XDG_CACHE_HOME',
+                                     os.path.join(os.environ['HOME'],
+                                                  '.cache'))
+    return os.path.join(base_dir, _PROGRAM_NAME)
+
+
+@functools.cache
 def _default_user_data_dir():
     return os.path.join('~', 'MUI_DATA')
 
@@ -312,6 +501,22 @@ _type_converters = {
 }
 
 
+def _is_readable_file(path) -> bool:
+    """Whether path is a file that can be opened for reading.
+
+    Opening the file checks both things in one go, instead of
+    checking separately with ``os.path.isfile`` and ``os.access``.
+    Opening a directory also fails, with ``IsADirectoryError`` or
+    ``PermissionError`` depending on the OS.
+    """
+    try:
+        with open(path, 'rb'):
+            pass
+    except OSError:
+        return False
+    return True
+
+
 def _get_nonempty_env(key, default):
     """Like ``os.getenv`` but returns ``default`` if key is empty string."""
     if os.getenv(key):
@@ -35,6 +35,26 @@ import cockpit.handlers.executor
 import time
 import cockpit.util
 
+
+def _z_function(seq):
+    """Z-array of a sequence, computed in linear time.
+
+    ``z[i]`` is the length of the longest common prefix of ``seq``
+    and ``seq[i:]`` (``z[0]`` is left as zero).
+    """
+    n = len(seq)
+    z = [0] * n
+    left = right = 0
+    for i in range(1, n):
+        if i < right:
+            z[i] = min(right - i, z[i - left])
+        while i + z[i] < n and seq[z[i]] == seq[i + z[i]]:
+            z[i] += 1
+        if i + z[i] > right:
+            left, right = i, i + z[i]
+    return z
+
+
 class _LastParameters():
     """A class to keep a record of last SIM parmeters using async calls."""
     def __init__(self, slm):
@@ -184,10 +204,12 @@ class BoulderSLM(device.Device):
         # Remove consecutive duplicates and position resets.
         reducedParams = [p[0] for p in groupby(patternParams)
                           if type(p[0]) is tuple]
-        # Find the repeating unit in the sequence.
+        # Find the repeating unit in the sequence, i.e., the shortest
+        # start of the sequence that is immediately repeated.
         sequenceLength = len(reducedParams)
+        z = _z_function(reducedParams)
         for length in range(2, len(reducedParams) // 2):
-            if reducedParams[0:length] == reducedParams[length:2*length]:
+            if z[length] >= length:
                 sequenceLength = length
                 break
         sequence = reducedParams[0:sequenceLength]
@@ -96,6 +96,18 @@ class ActionTable:
         return None, None
 
 
+    ## Retrieve the last time and action for every handler in the table,
+    # as a dict mapping handler to (time, parameter).  This is the same
+    # as calling getLastActionFor for each handler but only goes through
+    # the table once.
+    # NB assumes that self.actions has been sorted.
+    def getLastActions(self):
+        lastActions = {}
+        for time, handler, parameter in self.actions:
+            lastActions[handler] = (time, parameter)
+        return lastActions
+
+
     ## Sort all the actions in the table by time.
     # \todo We should remove redundant entries in here (e.g. due to 
     # 0 stabilization time for stage movement). 
@@ -109,10 +121,10 @@ class ActionTable:
     # the list; thus, the user sets it to None and then calls this function
     # afterwards.
     def clearBadEntries(self):
-        pairs = [item for item in enumerate(self.actions)]
-        for i, action in reversed(pairs):
-            if action is None:
-                del self.actions[i]
+        # Rebuild the list in one pass instead of deleting each entry,
+        # which would shift the rest of the list every time.  The
+        # list is modified in place in case someone holds a reference.
+        self.actions[:] = [a for a in self.actions if a is not None]
 
 
     ## Go through the table and ensure all timepoints are positive.
@@ -60,8 +60,10 @@ import cockpit.handlers.camera
 import cockpit.interfaces.stageMover
 
 import decimal
+import fractions
 import gc
 import logging
+import math
 import os
 import threading
 import time
@@ -89,6 +91,24 @@ def isRunning():
         return lastExperiment.is_running()
 
 
+## Return the number of Z slices needed to image a stack of the given
+# height with the given slice height.  The division is done exactly on
+# the decimal representation of the heights because float division can
+# land just above an integer (e.g. 4.9 / 0.7 is 7.000000000000001) and
+# so add a spurious slice.
+def getNumZSlices(zHeight, sliceHeight):
+    if zHeight <= 1e-6:
+        # 2D experiment; a single image.
+        return 1
+    if sliceHeight <= 0:
+        raise ValueError("Slice height must be positive for a %sum stack,"
+                         " got %sum" % (zHeight, sliceHeight))
+    numZSlices = math.ceil(fractions.Fraction(str(zHeight))
+                           / fractions.Fraction(str(sliceHeight)))
+    # Tack on an extra image to hit the top of the volume.
+    return numZSlices + 1
+
+
 ## This class is the root class for generating and running experiments.
 
 # You should make a subclass of this class to implement a specific experiment
@@ -662,6 +682,23 @@ class Experiment:
     #   after the last trigger event before it can be triggered again.
     def getTimeWhenCameraCanExpose(self, table, camera):
         lastUseTime, action = table.getLastActionFor(camera)
+        return self._getCameraReadyTime(camera, lastUseTime)
+
+    ## Return the time at which all the specified cameras can be
+    # exposed again.  Like calling getTimeWhenCameraCanExpose for each
+    # camera, but only goes through the action table once.
+    def getTimeWhenCamerasCanExpose(self, table, cameras):
+        lastActions = table.getLastActions()
+        readyTime = 0
+        for camera in cameras:
+            lastUseTime, action = lastActions.get(camera, (None, None))
+            readyTime = max(readyTime,
+                            self._getCameraReadyTime(camera, lastUseTime))
+        return readyTime
+
+    ## Return the time at which the camera can be exposed again, given
+    # the time of its last action in the table (None if it has none).
+    def _getCameraReadyTime(self, camera, lastUseTime):
         if lastUseTime is None:
             # No actions yet; assume camera is ready at the start of the
             # experiment.
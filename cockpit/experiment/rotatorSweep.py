@@ -31,6 +31,9 @@ import wx
 ## Provided so the UI knows what to call this experiment.
 EXPERIMENT_NAME = 'RotatorSweep'
 
+## Time between exposures so that all exposures are strictly ordered.
+_EXPOSURE_SEPARATION = decimal.Decimal('.001')
+
 
 ## This class handles classic Z-stack experiments.
 class RotatorSweepExperiment(experiment.Experiment):
@@ -65,7 +68,7 @@ class RotatorSweepExperiment(experiment.Experiment):
                 curTime = self.expose(curTime, cameras, lightTimePairs, table)
                 # Advance the time very slightly so that all exposures
                 # are strictly ordered.
-                curTime += decimal.Decimal('.001')
+                curTime += _EXPOSURE_SEPARATION
             # Hold the rotator angle constant during the exposure.
             table.addAction(curTime, self.lineHandler, vTarget)
             # Advance time slightly so all actions are sorted (e.g. we
@@ -60,7 +60,6 @@ import cockpit.util.datadoc
 import cockpit.util.userConfig
 
 import decimal
-import math
 import numpy
 import os
 import tempfile
@@ -191,11 +190,8 @@ class SIExperiment(experiment.Experiment):
         super().__init__(*args, **kwargs)
         self.numAngles = numAngles
         self.numPhases = numPhases
-        self.numZSlices = int(math.ceil(self.zHeight / self.sliceHeight))
-        if self.zHeight > 1e-6:
-            # Non-2D experiment; tack on an extra image to hit the top of
-            # the volume.
-            self.numZSlices += 1
+        self.numZSlices = experiment.getNumZSlices(self.zHeight,
+                                                   self.sliceHeight)
         self.collectionOrder = collectionOrder
         self.angleHandler = angleHandler
         self.phaseHandler = phaseHandler
@@ -209,14 +205,16 @@ class SIExperiment(experiment.Experiment):
     def genSIPositions(self):
         ordering = COLLECTION_ORDERS[self.collectionOrder]
         maxVals = (self.numAngles, self.numPhases, self.numZSlices)
+        # Position of each of angle, phase, and z in the loop order.
+        angleLoop, phaseLoop, zLoop = [ordering.index(n) for n in range(3)]
+        zPositions = [self.zStart + z * self.sliceHeight
+                      for z in range(self.numZSlices)]
         for i in range(maxVals[ordering[0]]):
             for j in range(maxVals[ordering[1]]):
                 for k in range(maxVals[ordering[2]]):
                     vals = (i, j, k)
-                    angle = vals[ordering.index(0)]
-                    phase = vals[ordering.index(1)]
-                    z = vals[ordering.index(2)]
-                    yield (angle, phase, self.zStart + z * self.sliceHeight)
+                    yield (vals[angleLoop], vals[phaseLoop],
+                           zPositions[vals[zLoop]])
 
 
     ## Create the ActionTable needed to run the experiment. We do three
@@ -571,7 +569,6 @@ class BaseSIMExperimentUI(wx.Panel):
         return params
 
     def _getDefaultSettings(self):
-        allLights = depot.getHandlersOfType(depot.LIGHT_TOGGLE)
         default = {
             'bleachCompensations': ['' for l in self.allLights],
             'siCollectionOrder': 0,
@@ -586,7 +583,6 @@ class BaseSIMExperimentUI(wx.Panel):
                 default = self._getDefaultSettings()
         )
 
-        allLights = depot.getHandlersOfType(depot.LIGHT_TOGGLE)
         if len(result['bleachCompensations']) != len(self.allLights):
             # Number of light sources has changed; invalidate the config.
             result['bleachCompensations'] = ['' for light in self.allLights]
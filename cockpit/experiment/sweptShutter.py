@@ -89,12 +89,9 @@ class OpenShutterSweepExperiment(experiment.Experiment):
             # Hold flat for the stabilization time, and any time needed for
             # the cameras to be ready. Only needed if we're doing multiple
             # reps, so we can proceed immediately to the next one.
-            cameraReadyTime = 0
             if self.numReps > 1:
-                for cameras, lightTimePairs in self.exposureSettings:
-                    for camera in cameras:
-                        cameraReadyTime = max(cameraReadyTime,
-                                self.getTimeWhenCameraCanExpose(table, camera))
+                cameraReadyTime = self.getTimeWhenCamerasCanExpose(
+                        table, self.cameras)
                 table.addAction(
                         max(curTime + stabilizationTime, cameraReadyTime),
                         self.zPositioner, 0)
@@ -55,7 +55,6 @@ from cockpit.experiment import actionTable
 from cockpit.experiment import experiment
 
 import decimal
-import math
 
 ## Provided so the UI knows what to call this experiment.
 EXPERIMENT_NAME = 'Z-stack'
@@ -68,23 +67,24 @@ class ZStackExperiment(experiment.Experiment):
     def generateActions(self):
         table = actionTable.ActionTable()
         curTime = 0
-        prevAltitude = None
-        numZSlices = int(math.ceil(self.zHeight / self.sliceHeight))
-        if self.zHeight > 1e-6:
-            # Non-2D experiment; tack on an extra image to hit the top of
-            # the volume.
-            numZSlices += 1
+        numZSlices = experiment.getNumZSlices(self.zHeight, self.sliceHeight)
+        # All moves between slices are the same distance so they all
+        # take the same time.
+        sliceMotionTime, sliceStabilizationTime = (
+            self.zPositioner.getMovementTime(0, self.sliceHeight))
         for zIndex in range(numZSlices):
             # Move to the next position, then wait for the stage to 
             # stabilize.
             zTarget = self.zStart + self.sliceHeight * zIndex
-            motionTime, stabilizationTime = 0, 0
-            if prevAltitude is not None:
-                motionTime, stabilizationTime = self.zPositioner.getMovementTime(prevAltitude, zTarget)
+            if zIndex == 0:
+                # We start at the first slice so no need to move.
+                motionTime, stabilizationTime = 0, 0
+            else:
+                motionTime = sliceMotionTime
+                stabilizationTime = sliceStabilizationTime
             curTime += motionTime
             table.addAction(curTime, self.zPositioner, zTarget)
             curTime += stabilizationTime
-            prevAltitude = zTarget
 
             # Image the sample.
             for cameras, lightTimePairs in self.exposureSettings:
@@ -103,14 +103,11 @@ class ZStackExperiment(experiment.Experiment):
         # Hold flat for the stabilization time, and any time needed for
         # the cameras to be ready. Only needed if we're doing multiple
         # reps, so we can proceed immediately to the next one.
-        cameraReadyTime = 0
         if self.numReps > 1:
-            for cameras, lightTimePairs in self.exposureSettings:
-                for camera in cameras:
-                    cameraReadyTime = max(cameraReadyTime,
-                            self.getTimeWhenCameraCanExpose(table, camera))
-        table.addAction(max(curTime + stabilizationTime, cameraReadyTime),
-                self.zPositioner, self.zStart)
+            cameraReadyTime = self.getTimeWhenCamerasCanExpose(table,
+                                                               self.cameras)
+            table.addAction(max(curTime + stabilizationTime, cameraReadyTime),
+                    self.zPositioner, self.zStart)
 
         return table
 
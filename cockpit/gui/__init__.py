@@ -66,24 +66,22 @@ And some of its modules are:
 """
 
 
+import importlib.resources
 import sys
 import traceback
 
-import pkg_resources
 import wx
 import wx.lib.newevent
 
 import cockpit.events
 
 
-## The resource_name argument for resource_filename is not a
-## filesystem filepath.  It is a /-separated filepath, even on
-## windows, so do not use os.path.join.
+## The argument for joinpath is not a filesystem filepath.  It is a
+## /-separated filepath, even on windows, so do not use os.path.join.
 
-IMAGES_PATH = pkg_resources.resource_filename(
-    'cockpit',
+IMAGES_PATH = str(importlib.resources.files('cockpit').joinpath(
     'resources/images/'
-)
+))
 
 
 ## A single event type for all cockpit.events. The origian cockpit
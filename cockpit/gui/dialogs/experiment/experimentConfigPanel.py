@@ -56,10 +56,10 @@ from cockpit.gui import guiUtils
 import cockpit.interfaces.stageMover
 import cockpit.util.userConfig
 
-import collections
 import decimal
 import json
 import logging
+import operator
 import os.path
 import time
 import traceback
@@ -109,13 +109,24 @@ class ExperimentConfigPanel(wx.Panel):
         self.runner = None
 
         self.allLights = wx.GetApp().Depot.getHandlersOfType(depot.LIGHT_TOGGLE)
-        self.allLights.sort(key = lambda l: l.wavelength)
+        self.allLights.sort(key = operator.attrgetter('wavelength'))
         self.allCameras = wx.GetApp().Depot.getHandlersOfType(depot.CAMERA)
-        self.allCameras.sort(key = lambda c: c.name)
+        self.allCameras.sort(key = operator.attrgetter('name'))
 
         ## Map of default settings as loaded from config.
         self.settings = self.loadConfig()
 
+        # Don't repaint while creating and laying out all the controls.
+        self.Freeze()
+        try:
+            self.createControls()
+        finally:
+            self.Thaw()
+
+
+    ## Create and lay out all the controls.  Called once, from the
+    # constructor.
+    def createControls(self):
         self.SetSizer(wx.BoxSizer(wx.VERTICAL))
         self.sizer = self.GetSizer()
 
@@ -123,7 +134,7 @@ class ExperimentConfigPanel(wx.Panel):
         universalSizer = wx.FlexGridSizer(2, 3, 5, 5)
 
         ## Maps experiment description strings to experiment modules.
-        self.experimentStringToModule = collections.OrderedDict()
+        self.experimentStringToModule = {}
         for module in cockpit.experiment.experimentRegistry.getExperimentModules():
             self.experimentStringToModule[module.EXPERIMENT_NAME] = module            
         
@@ -163,18 +174,11 @@ class ExperimentConfigPanel(wx.Panel):
         self.sizer.Add(universalSizer, 0, wx.ALL, border=5)
 
         ## Maps experiment modules to ExperimentUI instances holding the
-        # UI for that experiment, if any.
+        # UI for that experiment, if any.  Panels are only created when
+        # first needed, see getExperimentPanel.
         self.experimentModuleToPanel = {}
-        for module in self.experimentStringToModule.values():
-            if not hasattr(module, 'ExperimentUI'):
-                # This experiment type has no special UI to set up.
-                continue
-            panel = module.ExperimentUI(self, self.configKey)
-            panel.Hide()
-            self.sizer.Add(panel)
-            self.experimentModuleToPanel[module] = panel
         self.experimentType.Bind(wx.EVT_CHOICE, self.onExperimentTypeChoice)
-        self.onExperimentTypeChoice()
+        self.showExperimentPanel()
 
         # Section for exposure settings. We allow either setting per-laser
         # exposure times and activating all cameras as a group, or setting
@@ -194,10 +198,11 @@ class ExperimentConfigPanel(wx.Panel):
                 wx.StaticText(self.simultaneousExposurePanel, -1, "Exposure times for light sources:"),
                 0, wx.ALL, 5)
         
+        lightNames = [str(l.name) for l in self.allLights]
         ## Ordered list of exposure times for simultaneous exposure mode.
         self.lightExposureTimes, timeSizer = guiUtils.makeLightsControls(
                 self.simultaneousExposurePanel,
-                [str(l.name) for l in self.allLights],
+                lightNames,
                 self.settings['simultaneousExposureTimes'])
         simultaneousSizer.Add(timeSizer)
         useCurrentButton = wx.Button(self.simultaneousExposurePanel, -1, 
@@ -217,7 +222,7 @@ class ExperimentConfigPanel(wx.Panel):
                 len(self.settings['sequencedExposureSettings']) + 1,
                 len(self.settings['sequencedExposureSettings'][0]) + 1,
                 1, 1)
-        for label in [''] + [str(l.name) for l in self.allLights]:
+        for label in [''] + lightNames:
             sequenceSizer.Add(
                     wx.StaticText(self.sequencedExposurePanel, -1, label),
                     0, wx.ALIGN_RIGHT | wx.ALL, 5)
@@ -226,7 +231,7 @@ class ExperimentConfigPanel(wx.Panel):
                     wx.StaticText(self.sequencedExposurePanel, -1, str(camera.name)),
                     0, wx.TOP | wx.ALIGN_RIGHT, 8)
             times = []
-            for (label, defaultVal) in zip([str(l.name) for l in self.allLights],
+            for (label, defaultVal) in zip(lightNames,
                                            self.settings['sequencedExposureSettings'][i]):
                 exposureTime = wx.TextCtrl(
                         self.sequencedExposurePanel, size = (40, -1),
@@ -245,12 +250,12 @@ class ExperimentConfigPanel(wx.Panel):
         # Toggle which panel is displayed based on the checkbox.
         self.shouldExposeSimultaneously.Bind(wx.EVT_CHECKBOX, self.onExposureCheckbox)
         self.shouldExposeSimultaneously.SetValue(self.settings['shouldExposeSimultaneously'])
-        self.onExposureCheckbox()
+        self.showExposurePanel()
 
         self.filepath_panel = FilepathPanel(self)
         self.filepath_panel.SetTemplate(self.settings['filenameTemplate'])
         self.filepath_panel.UpdateFilename()
-        self.Sizer.Add(self.filepath_panel, wx.SizerFlags(1).Expand().Border())
+        self.sizer.Add(self.filepath_panel, wx.SizerFlags(1).Expand().Border())
 
         # Save/load experiment settings buttons.
         saveLoadPanel = wx.Panel(self)
@@ -264,6 +269,8 @@ class ExperimentConfigPanel(wx.Panel):
         saveLoadPanel.SetSizerAndFit(rowSizer)
         self.sizer.Add(saveLoadPanel, 0, wx.LEFT, 5)
         
+        # Lay out once, now that all the controls are in place.  Our
+        # parent lays itself out after adding us.
         self.SetSizerAndFit(self.sizer)
 
 
@@ -305,25 +312,65 @@ class ExperimentConfigPanel(wx.Panel):
         return result
 
 
+    ## Return the ExperimentUI panel for the specified experiment module,
+    # creating it if this is the first time it is needed, or None if the
+    # experiment type has no special UI.
+    def getExperimentPanel(self, module):
+        if not hasattr(module, 'ExperimentUI'):
+            return None
+        if module not in self.experimentModuleToPanel:
+            panel = module.ExperimentUI(self, self.configKey)
+            panel.Hide()
+            # Tab order follows creation order, not sizer position, so
+            # put the panel right after the universal settings.
+            panel.MoveAfterInTabOrder(self.sliceHeight)
+            # Experiment specific panels go right after the settings
+            # that are universal to all experiment types.
+            self.sizer.Insert(1, panel)
+            self.experimentModuleToPanel[module] = panel
+        return self.experimentModuleToPanel[module]
+
+
     ## User selected a different experiment type; show/hide specific
     # experiment parameters as appropriate; depending on experiment type, 
     # some controls may be enabled/disabled.
     def onExperimentTypeChoice(self, event = None):
-        newType = self.experimentType.GetStringSelection()
-        for expString, module in self.experimentStringToModule.items():
-            if module in self.experimentModuleToPanel:
-                # This experiment module has a special UI panel which needs
-                # to be shown/hidden.
-                panel = self.experimentModuleToPanel[module]
-                panel.Show(expString == newType)
-                panel.Enable(expString == newType)
-        self.SetSizerAndFit(self.sizer)
+        self.Freeze()
+        try:
+            self.showExperimentPanel()
+            self.SetSizerAndFit(self.sizer)
+        finally:
+            self.Thaw()
         self.resizeCallback(self)
 
 
+    ## Show the panel for the selected experiment type, if any, and
+    # hide the others.  Does not update the layout.
+    def showExperimentPanel(self):
+        newType = self.experimentType.GetStringSelection()
+        newPanel = self.getExperimentPanel(
+            self.experimentStringToModule[newType]
+        )
+        for panel in self.experimentModuleToPanel.values():
+            panel.Show(panel is newPanel)
+            panel.Enable(panel is newPanel)
+
+
     ## User toggled the exposure controls; show/hide the panels as
     # appropriate.
     def onExposureCheckbox(self, event = None):
+        self.Freeze()
+        try:
+            self.showExposurePanel()
+            self.SetSizerAndFit(self.sizer)
+        finally:
+            self.Thaw()
+        self.resizeCallback(self)
+
+
+    ## Show the exposure panel for the selected exposure mode and hide
+    # the other.  Does not update the layout.
+    def showExposurePanel(self):
         val = self.shouldExposeSimultaneously.GetValue()
         # Show the relevant light panel. Disable the unused panel to
         # prevent validation of its controls.
@@ -331,8 +378,6 @@ class ExperimentConfigPanel(wx.Panel):
         self.simultaneousExposurePanel.Enable(val)
         self.sequencedExposurePanel.Show(not val)
         self.sequencedExposurePanel.Enable(not val)
-        self.SetSizerAndFit(self.sizer)
-        self.resizeCallback(self)
 
 
     ## User clicked the "Use current settings" button; fill out the 
@@ -355,28 +400,29 @@ class ExperimentConfigPanel(wx.Panel):
         # experiment.
         experimentType = self.experimentType.GetStringSelection()
         settings['experimentType'] = experimentType
-        module = self.experimentStringToModule[experimentType]
-        if module in self.experimentModuleToPanel:
+        panel = self.getExperimentPanel(
+            self.experimentStringToModule[experimentType]
+        )
+        if panel is not None:
             # Have specific parameters for this experiment type; store them
             # too.
-            settings['experimentSpecificValues'] = self.experimentModuleToPanel[module].getSettingsDict()
+            settings['experimentSpecificValues'] = panel.getSettingsDict()
 
         # Get the filepath to save settings to.
         dialog = wx.FileDialog(self, style = wx.FD_SAVE, wildcard = '*.txt',
                 message = 'Please select where to save the experiment.',
-                defaultDir=wx.GetApp().Config.getpath('global', 'data-dir'))
+                defaultDir=wx.GetApp().Config.data_dir)
         if dialog.ShowModal() != wx.ID_OK:
             # User cancelled.
             return
         filepath = dialog.GetPath()
-        handle = open(filepath, 'w')
         try:
-            handle.write(json.dumps(settings))
+            with open(filepath, 'w') as handle:
+                json.dump(settings, handle)
         except Exception as e:
             _logger.error("Couldn't save experiment settings: %s" % e)
             _logger.error(traceback.format_exc())
             _logger.error("Settings are:\n%s" % str(settings))
-        handle.close()
         
 
     ## User clicked the "Load experiment settings..." button; load the
@@ -384,19 +430,19 @@ class ExperimentConfigPanel(wx.Panel):
     def onLoadExperiment(self, event = None):
         dialog = wx.FileDialog(self, style = wx.FD_OPEN, wildcard = '*.txt',
                 message = 'Please select the experiment file to load.',
-                defaultDir=wx.GetApp().Config.getpath('global', 'data-dir'))
+                defaultDir=wx.GetApp().Config.data_dir)
         if dialog.ShowModal() != wx.ID_OK:
             # User cancelled.
             return
         filepath = dialog.GetPath()
-        handle = open(filepath, 'r')
-        settings = json.loads(' '.join(handle.readlines()))
-        handle.close()
+        with open(filepath, 'r') as handle:
+            settings = json.load(handle)
         experimentType = settings['experimentType']
         experimentIndex = self.experimentType.FindString(experimentType)
-        module = self.experimentStringToModule[experimentType]
-        if module in self.experimentModuleToPanel:
-            panel = self.experimentModuleToPanel[module]
+        panel = self.getExperimentPanel(
+            self.experimentStringToModule[experimentType]
+        )
+        if panel is not None:
             panel.saveSettings(settings['experimentSpecificValues'])
             del settings['experimentSpecificValues']
         cockpit.util.userConfig.setValue(self.configKey, settings)
@@ -415,10 +461,7 @@ class ExperimentConfigPanel(wx.Panel):
         # to be our experiment mover.
         mover = wx.GetApp().Depot.getSortedStageMovers()[2][-1]
         # Only use active cameras and enabled lights.
-        # Must do list(filter) because we will iterate over the list
-        # many times.
-        cameras = list(filter(lambda c: c.getIsEnabled(),
-                wx.GetApp().Depot.getHandlersOfType(depot.CAMERA)))
+        cameras = [c for c in self.allCameras if c.getIsEnabled()]
         if not cameras:
             wx.MessageDialog(self,
                     message = "No cameras are enabled, so the experiment cannot be run.",
@@ -430,7 +473,7 @@ class ExperimentConfigPanel(wx.Panel):
             # A single exposure event with all cameras and lights.
             lightTimePairs = []
             for i, light in enumerate(self.allLights):
-                if (self.allLights[i].getIsEnabled() and
+                if (light.getIsEnabled() and
                         self.lightExposureTimes[i].GetValue()):
                     lightTimePairs.append(
                         (light, guiUtils.tryParseNum(self.lightExposureTimes[i], decimal.Decimal)))
@@ -444,12 +487,13 @@ class ExperimentConfigPanel(wx.Panel):
             exposureSettings = [(cameras, lightTimePairs)]
         else:
             # A separate exposure for each camera.
+            enabledLights = [(i, light)
+                             for i, light in enumerate(self.allLights)
+                             if light.getIsEnabled()]
             for camera in cameras:
                 cameraSettings = self.cameraToExposureTimes[camera]
                 settings = []
-                for i, light in enumerate(self.allLights):
-                    if not light.getIsEnabled():
-                        continue
+                for i, light in enabledLights:
                     timeControl = cameraSettings[i]
                     if timeControl.GetValue():
                         settings.append((light, guiUtils.tryParseNum(timeControl, decimal.Decimal)))
@@ -491,9 +535,10 @@ class ExperimentConfigPanel(wx.Panel):
         }
         experimentType = self.experimentType.GetStringSelection()
         module = self.experimentStringToModule[experimentType]
-        if module in self.experimentModuleToPanel:
+        panel = self.getExperimentPanel(module)
+        if panel is not None:
             # Add on the special parameters needed by this experiment type.
-            params = self.experimentModuleToPanel[module].augmentParams(params)
+            params = panel.augmentParams(params)
 
         self.runner = module.EXPERIMENT_CLASS(**params)
         return self.runner.run()
@@ -531,7 +576,7 @@ class FilepathPanel(wx.Panel):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._dir_ctrl = wx.DirPickerCtrl(
-            self, path=wx.GetApp().Config.getpath('global', 'data-dir')
+            self, path=wx.GetApp().Config.data_dir
         )
         self._template_ctrl = wx.TextCtrl(self)
         self._template_ctrl.SetToolTip(
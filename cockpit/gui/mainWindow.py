@@ -54,9 +54,9 @@
 # responsible for setting up the user interface; it assume that the
 # devices have already been initialized.
 
+import importlib.metadata
 import io
 import os.path
-import pkg_resources
 import subprocess
 import sys
 import typing
@@ -705,7 +705,7 @@ def CockpitAboutInfo() -> wx.adv.AboutDialogInfo:
     info = wx.adv.AboutDialogInfo()
     info.SetName('Cockpit')
 
-    info.SetVersion(pkg_resources.get_distribution('cockpit').version)
+    info.SetVersion(importlib.metadata.version('microscope-cockpit'))
     info.SetDescription('Hardware agnostic microscope user interface')
     info.SetCopyright('Copyright © 2020\n'
                       '\n'
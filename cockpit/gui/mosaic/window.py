@@ -1086,7 +1086,7 @@ class MosaicWindow(wx.Frame, MosaicCommon):
     def saveSitesToFile(self, event = None):
         dialog = wx.FileDialog(self, style = wx.FD_SAVE, wildcard = '*.txt',
                 message = "Please select where to save the file.",
-                defaultDir=wx.GetApp().Config.getpath('global', 'data-dir'))
+                defaultDir=wx.GetApp().Config.data_dir)
         if dialog.ShowModal() != wx.ID_OK:
             return
         cockpit.interfaces.stageMover.writeSitesToFile(dialog.GetPath())
@@ -1096,7 +1096,7 @@ class MosaicWindow(wx.Frame, MosaicCommon):
     def loadSavedSites(self, event = None):
         dialog = wx.FileDialog(self, style = wx.FD_OPEN, wildcard = '*.txt',
                 message = "Please select the file to load.",
-                defaultDir=wx.GetApp().Config.getpath('global', 'data-dir'))
+                defaultDir=wx.GetApp().Config.data_dir)
         if dialog.ShowModal() != wx.ID_OK:
             return
         cockpit.interfaces.stageMover.loadSites(dialog.GetPath())
@@ -1228,7 +1228,7 @@ class MosaicWindow(wx.Frame, MosaicCommon):
     def saveMosaic(self, event = None):
         dialog = wx.FileDialog(self, style = wx.FD_SAVE, wildcard = '*.txt',
                 message = "Please select where to save the file.",
-                defaultDir=wx.GetApp().Config.getpath('global', 'data-dir'))
+                defaultDir=wx.GetApp().Config.data_dir)
         if dialog.ShowModal() != wx.ID_OK:
             return
         self.canvas.saveTiles(dialog.GetPath())
@@ -120,6 +120,18 @@ class TestActionTable(unittest.TestCase):
         self.action_table.addAction(3, None, None)
         self.assertEqual((1, 3), self.action_table.getFirstAndLastActionTimes())
 
+    def test_getLastActions(self):
+        h1 = object()
+        h2 = object()
+        self.action_table.addAction(0, h1, 'a')
+        self.action_table.addAction(1, h2, 'b')
+        self.action_table.addAction(2, h1, 'c')
+        lastActions = self.action_table.getLastActions()
+        self.assertEqual({h1: (2, 'c'), h2: (1, 'b')}, lastActions)
+        for handler in (h1, h2):
+            self.assertEqual(self.action_table.getLastActionFor(handler),
+                             lastActions[handler])
+
     def test_addToggle(self):
         # Toggles are represented by 2 events
         self.action_table.addToggle(1, _MockDeviceHandler())
@@ -140,6 +152,14 @@ class TestActionTable(unittest.TestCase):
         self.action_table.clearBadEntries()
         self.assertEqual(0, len(self.action_table))
 
+    def test_clearBadEntries_keeps_order(self):
+        for t in range(5):
+            self.action_table.addAction(t, None, None)
+        self.action_table[1] = None
+        self.action_table[3] = None
+        self.action_table.clearBadEntries()
+        self.assertEqual([0, 2, 4], [a[0] for a in self.action_table])
+
     def test_clearBadEntries_no_bad_entries(self):
         # Nothing should happen to normal entries
         self.action_table.addAction(1, None, None)
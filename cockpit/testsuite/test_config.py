@@ -46,9 +46,25 @@ def patch_like_linux(func):
     return posix_path(not_mac(not_win(func)))
 
 
+def clear_default_dirs_cache():
+    """Forget default directories computed from previous environment."""
+    for default_dir in (cockpit.config._default_system_config_dirs,
+                        cockpit.config._default_user_config_dir,
+                        cockpit.config._default_log_dir,
+                        cockpit.config._default_user_cache_dir,
+                        cockpit.config._default_user_data_dir):
+        default_dir.cache_clear()
+
+
+@contextlib.contextmanager
 def patched_env(values):
     """Patch env by adding/replacing variables."""
-    return unittest.mock.patch.dict('os.environ', values)
+    clear_default_dirs_cache()
+    try:
+        with unittest.mock.patch.dict('os.environ', values):
+            yield
+    finally:
+        clear_default_dirs_cache()
 
 
 class MockConfigRead:
@@ -88,7 +104,10 @@ def patched_config_dirs(system_basedirs, user_basedir):
 
 
 def call_cockpit(*args):
-    parsed_args = cockpit._parse_cmd_line_args(["cockpit", *args])
+    ## Do not use the depot cache, otherwise the tests would leave
+    ## cache files in the user cache directory.
+    parsed_args = cockpit._parse_cmd_line_args(["cockpit",
+                                                "--no-config-cache", *args])
     return cockpit.config.CockpitConfig(parsed_args)
 
 
@@ -567,6 +586,112 @@ class TestDepotConfig(unittest.TestCase):
         self.assertEqual(depot['filters'].get('filters'),
                          '\n0, ND 1%\n1, ND 10%')
 
+    def test_same_as_configparser(self):
+        """Files read same as ConfigParser, with or without fast parser."""
+        for content in ('[dev1]\n'
+                        'Type = foo.Bar\n'
+                        '# comment\n'
+                        'uri: PYRO:Device@127.0.0.1:8000\n'
+                        '\n'
+                        '[dev2]\n'
+                        'empty =\n',
+                        '[dev1]\n'
+                        'lines:\n'
+                        '  a\n'
+                        '  b\n',
+                        ## Not line breaks for ConfigParser.
+                        '[dev1]\n'
+                        'key = a\x0cb=c\n'
+                        'other = d\x1de=f\n'):
+            conf_file = TempConfigFile(content)
+            expected = configparser.ConfigParser()
+            expected.read(conf_file.path)
+            depot = cockpit.config.DepotConfig(conf_file.path)
+            self.assertEqual(depot.sections(), expected.sections())
+            for section in expected.sections():
+                self.assertEqual(dict(depot[section]),
+                                 dict(expected[section]))
+
+    def test_fast_parse_line_breaks(self):
+        """Only newlines are line breaks, same as ConfigParser."""
+        text = ('[dev1]\n'
+                'key = a\x85b=c\n'
+                'other = d\u2028e: f\n')
+        expected = configparser.ConfigParser()
+        expected.read_string(text)
+        self.assertEqual(cockpit.config._fast_parse(text),
+                         {'dev1': dict(expected['dev1'])})
+
+    def test_cache(self):
+        """Cached depot files are invalidated when the file changes."""
+        conf_file = TempConfigFile('[dev]\n'
+                                   'type: foo\n')
+        with tempfile.TemporaryDirectory() as cache_dir:
+            depot = cockpit.config.DepotConfig(conf_file.path,
+                                               cache_dir=cache_dir)
+            self.assertEqual(dict(depot['dev']), {'type': 'foo'})
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            with unittest.mock.patch('cockpit.config._fast_parse') as parse:
+                depot = cockpit.config.DepotConfig(conf_file.path,
+                                                   cache_dir=cache_dir)
+            parse.assert_not_called()
+            self.assertEqual(dict(depot['dev']), {'type': 'foo'})
+
+            with open(conf_file.path, 'w') as fh:
+                fh.write('[dev]\n'
+                         'type: barqux\n')
+            depot = cockpit.config.DepotConfig(conf_file.path,
+                                               cache_dir=cache_dir)
+            self.assertEqual(dict(depot['dev']), {'type': 'barqux'})
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_cache_version(self):
+        """Cache files from another cache version are not reused."""
+        conf_file = TempConfigFile('[dev]\n'
+                                   'type: foo\n')
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cockpit.config.DepotConfig(conf_file.path, cache_dir=cache_dir)
+            with unittest.mock.patch('cockpit.config._DEPOT_CACHE_VERSION',
+                                     cockpit.config._DEPOT_CACHE_VERSION+1):
+                with unittest.mock.patch('cockpit.config._fast_parse',
+                                         return_value={}) as parse:
+                    depot = cockpit.config.DepotConfig(conf_file.path,
+                                                       cache_dir=cache_dir)
+            parse.assert_called_once()
+            self.assertEqual(depot.sections(), [])
+
+    def test_cache_encoding(self):
+        """Cached depot files are not reused for another encoding."""
+        with tempfile.NamedTemporaryFile(mode='wb') as conf_file:
+            conf_file.write('[dev]\ntype: \u00e9\n'.encode('utf-8'))
+            conf_file.flush()
+            with tempfile.TemporaryDirectory() as cache_dir:
+                for encoding, value in (('utf-8', '\u00e9'),
+                                        ('latin-1', '\u00c3\u00a9')):
+                    depot = cockpit.config.DepotConfig([],
+                                                       cache_dir=cache_dir)
+                    depot.read(conf_file.name, encoding=encoding)
+                    self.assertEqual(dict(depot['dev']), {'type': value})
+
+
+class TestGlobalOptions(unittest.TestCase):
+    def test_converted_options(self):
+        """Global options are available already converted."""
+        depot_file = TempConfigFile()
+        config_file = TempConfigFile('[global]\n'
+                                     'data-dir = $FOO/data\n'
+                                     'channel-files =\n'
+                                     '  /a/channels\n'
+                                     '  /b/channels\n')
+        with patched_env({'FOO' : '/foo'}):
+            config = call_cockpit('--no-config-files',
+                                  '--config-file', config_file.path,
+                                  '--depot-file', depot_file.path)
+        self.assertEqual(config.data_dir, '/foo/data')
+        self.assertEqual(config.channel_files, ['/a/channels', '/b/channels'])
+        self.assertEqual(config.depot_files, [depot_file.path])
+
 
 class TestCommandLineOptions(unittest.TestCase):
     def test_debug(self):
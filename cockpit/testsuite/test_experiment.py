@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+## Copyright (C) 2021 University of Oxford
+##
+## This file is part of Cockpit.
+##
+## Cockpit is free software: you can redistribute it and/or modify
+## it under the terms of the GNU General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## (at your option) any later version.
+##
+## Cockpit is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with Cockpit.  If not, see <http://www.gnu.org/licenses/>.
+
+import decimal
+import unittest
+
+import cockpit.experiment.experiment as experiment
+
+
+class TestNumZSlices(unittest.TestCase):
+    def test_2D(self):
+        ## The experiment panel uses 1e-6 for both heights on 2D
+        ## experiments.
+        self.assertEqual(experiment.getNumZSlices(1e-6, 1e-6), 1)
+
+    def test_exact_division(self):
+        self.assertEqual(experiment.getNumZSlices(3.0, 0.1), 31)
+
+    def test_float_rounding(self):
+        ## 4.9 / 0.7 is slightly more than 7 in floating point.
+        self.assertGreater(4.9 / 0.7, 7)
+        self.assertEqual(experiment.getNumZSlices(4.9, 0.7), 8)
+        self.assertEqual(experiment.getNumZSlices(2.1, 0.3), 8)
+
+    def test_partial_slice(self):
+        self.assertEqual(experiment.getNumZSlices(1.05, 0.1), 12)
+
+    def test_sub_nanometre_slice_height(self):
+        self.assertEqual(experiment.getNumZSlices(1.0, 0.0125), 81)
+        self.assertEqual(experiment.getNumZSlices(1.0, 0.0025), 401)
+        self.assertEqual(experiment.getNumZSlices(1.0, 0.0004), 2501)
+
+    def test_zero_slice_height(self):
+        with self.assertRaises(ValueError):
+            experiment.getNumZSlices(3.0, 0)
+
+    def test_decimal(self):
+        self.assertEqual(experiment.getNumZSlices(decimal.Decimal('1.1'),
+                                                  decimal.Decimal('0.1')),
+                         12)
+
+
+if __name__ == '__main__':
+    unittest.main()